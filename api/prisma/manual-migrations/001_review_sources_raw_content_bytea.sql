@@ -0,0 +1,23 @@
+-- review_sources.raw_content: text -> bytea (zstd-compressed by the scraper)
+--
+-- Run against the remote PostgreSQL database BEFORE `npm run db:push:remote`
+-- and before deploying scraper workers that write compressed content.
+-- `db push` cannot convert the column in place and would drop it instead.
+--
+-- Existing rows are converted to their UTF-8 bytes and stay uncompressed.
+-- Safe to re-run: does nothing once the column is already bytea.
+
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1
+    FROM information_schema.columns
+    WHERE table_name = 'review_sources'
+      AND column_name = 'raw_content'
+      AND data_type = 'text'
+  ) THEN
+    ALTER TABLE review_sources
+      ALTER COLUMN raw_content TYPE bytea
+      USING convert_to(raw_content, 'UTF8');
+  END IF;
+END $$;
@@ -5,11 +5,13 @@ from .settings import get_settings
 
 settings = get_settings()
 
+# Sized for concurrent scraper tasks; PostgreSQL's max_connections is the real cap
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=1800,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -5,12 +5,16 @@ from functools import lru_cache
 class Settings(BaseSettings):
     # Database
     database_url: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
 
     # Redis
     redis_url: str = "redis://localhost:6379"
 
     # Anthropic
     anthropic_api_key: str
+    anthropic_max_concurrency: int = 5
+    review_analysis_cache_dir: str = "./.cache/review_analysis"
 
     # Reddit (PRAW)
     reddit_client_id: str = ""
@@ -20,6 +24,9 @@ class Settings(BaseSettings):
     # YouTube
     youtube_api_key: str = ""
 
+    # Playwright
+    playwright_profile_dir: str = "./.pw-profiles"
+
     # Proxy (optional)
     proxy_url: str = ""
 
@@ -32,6 +39,6 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     return Settings()
@@ -1,3 +1,4 @@
 from .rating_calculator import rating_calculator, ProductRating, ReviewAnalysis
+from .dedupe import dedupe_reviews
 
-__all__ = ["rating_calculator", "ProductRating", "ReviewAnalysis"]
+__all__ = ["rating_calculator", "ProductRating", "ReviewAnalysis", "dedupe_reviews"]
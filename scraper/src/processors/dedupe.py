@@ -0,0 +1,73 @@
+import hashlib
+import re
+import numpy as np
+from collections import defaultdict
+from ..scrapers.base import ScrapedReview
+
+# Word tokens; punctuation and leftover markup are ignored
+_TOKEN_RE = re.compile(r"\w+")
+
+# Words per shingle hashed into the signature
+SHINGLE_SIZE = 3
+
+# Reviews whose 64-bit signatures differ in at most this many bits are
+# treated as near-duplicates
+MAX_HAMMING_DISTANCE = 3
+
+# Signatures are indexed by four 16-bit bands. Two signatures within
+# MAX_HAMMING_DISTANCE bits must agree exactly on at least one band, so only
+# reviews sharing a band need to be compared.
+BAND_BITS = 16
+BAND_COUNT = 64 // BAND_BITS
+BAND_MASK = (1 << BAND_BITS) - 1
+
+
+def simhash(content: str) -> int:
+    """Compute a 64-bit SimHash signature over word shingles of the content."""
+    tokens = _TOKEN_RE.findall(content.lower())
+    shingles = [
+        " ".join(tokens[i:i + SHINGLE_SIZE])
+        for i in range(max(len(tokens) - SHINGLE_SIZE + 1, 1))
+    ]
+
+    digests = b"".join(
+        hashlib.blake2b(shingle.encode(), digest_size=8).digest() for shingle in shingles
+    )
+    bits = np.unpackbits(
+        np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8), axis=1, bitorder="little"
+    )
+
+    # Each bit is set when most shingle hashes have it set
+    signature_bits = bits.sum(axis=0) * 2 > len(shingles)
+    return int.from_bytes(np.packbits(signature_bits, bitorder="little").tobytes(), "little")
+
+
+def _bands(signature: int) -> list[int]:
+    """Split a signature into its 16-bit bands."""
+    return [(signature >> (i * BAND_BITS)) & BAND_MASK for i in range(BAND_COUNT)]
+
+
+def dedupe_reviews(reviews: list[ScrapedReview]) -> list[ScrapedReview]:
+    """Drop reviews whose content nearly duplicates an earlier review."""
+    kept = []
+    band_tables: list[defaultdict[int, list[int]]] = [
+        defaultdict(list) for _ in range(BAND_COUNT)
+    ]
+
+    for review in reviews:
+        signature = simhash(review.content)
+        bands = _bands(signature)
+
+        is_duplicate = any(
+            (signature ^ other).bit_count() <= MAX_HAMMING_DISTANCE
+            for table, band in zip(band_tables, bands)
+            for other in table[band]
+        )
+        if is_duplicate:
+            continue
+
+        kept.append(review)
+        for table, band in zip(band_tables, bands):
+            table[band].append(signature)
+
+    return kept
@@ -1,5 +1,18 @@
+import asyncio
+import hashlib
+from bisect import bisect_left
 import anthropic
-from dataclasses import dataclass
+import numpy as np
+from collections import Counter
+from itertools import zip_longest
+from dataclasses import asdict, dataclass
+from diskcache import Cache
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 from typing import Optional
 from ..scrapers.base import ScrapedReview
 from ..config.settings import get_settings
@@ -44,74 +57,275 @@ SOURCE_CREDIBILITY = {
     "unknown": 0.50,
 }
 
+# Credibility bonus for engagement: more than 10, 50 or 100 upvotes
+ENGAGEMENT_THRESHOLDS = (10, 50, 100)
+ENGAGEMENT_BONUSES = (0.0, 0.02, 0.05, 0.1)
+
+ANALYSIS_MODEL = "claude-sonnet-4-20250514"
+
+# Bump when the analysis prompt changes to invalidate cached analyses
+ANALYSIS_PROMPT_VERSION = "1"
+
+# Cached review analyses expire after 30 days
+ANALYSIS_CACHE_TTL = 30 * 86400
+
+# Reviews are truncated to this many characters before analysis
+MAX_REVIEW_CHARS = 3000
+
+# Most reviews analyzed per product
+MAX_ANALYZED_REVIEWS = 20
+
+# Approximate input-token budget for a single batched analysis prompt
+BATCH_TOKEN_BUDGET = 8000
+
+# Tool schema Claude must fill in, so analyses come back as structured JSON.
+# The summary is only requested when the whole product fits in one batch.
+ANALYSIS_TOOL = {
+    "name": "emit_analysis",
+    "description": "Record the sentiment, pros and cons extracted from each review.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "analyses": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer", "description": "Review id from [[id]]"},
+                        "sentiment": {
+                            "type": "number",
+                            "minimum": -1.0,
+                            "maximum": 1.0,
+                            "description": "-1.0 very negative to 1.0 very positive",
+                        },
+                        "pros": {"type": "array", "items": {"type": "string"}, "maxItems": 3},
+                        "cons": {"type": "array", "items": {"type": "string"}, "maxItems": 3},
+                    },
+                    "required": ["id", "sentiment", "pros", "cons"],
+                },
+            },
+            "summary": {
+                "type": "string",
+                "description": "2-sentence summary of user opinions, if requested",
+            },
+        },
+        "required": ["analyses"],
+    },
+}
+
+# Status codes worth retrying, matching the SDK's own retry policy: request
+# timeout, lock conflict, rate limit and any server error (incl. 529 overloaded,
+# whose OverloadedError is not an InternalServerError subclass)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Whether a failed Claude call is worth retrying."""
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500
+    return False
+
+
+def _log_retry(retry_state) -> None:
+    """Log a retried Claude call before backing off."""
+    print(
+        f"Claude call failed ({retry_state.outcome.exception()}), "
+        f"retrying in {retry_state.next_action.sleep:.1f}s "
+        f"(attempt {retry_state.attempt_number})"
+    )
+
 
 class RatingCalculator:
     """Calculates product ratings from aggregated reviews using AI."""
 
     def __init__(self):
-        self.client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-    async def analyze_review(self, review: ScrapedReview) -> ReviewAnalysis:
-        """Analyze a single review for sentiment and key points."""
+        # aiohttp transport handles many concurrent requests better than httpx
+        self.client = anthropic.AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=anthropic.DefaultAioHttpClient(),
+            max_retries=0,  # Retries are handled by _create_message
+        )
+        # Bound in-flight requests to stay under the per-key rate limits
+        self._sem = asyncio.Semaphore(settings.anthropic_max_concurrency)
+        # Analyses keyed by review content, shared across scraper runs.
+        # Opened on first use so importing this module creates no files.
+        self._cache: Optional[Cache] = None
+
+    @property
+    def cache(self) -> Cache:
+        """On-disk cache of review analyses, opened on first use."""
+        if self._cache is None:
+            self._cache = Cache(settings.review_analysis_cache_dir)
+        return self._cache
+
+    @retry(
+        wait=wait_exponential(multiplier=1, max=30),
+        stop=stop_after_attempt(3),
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=_log_retry,
+        reraise=True,
+    )
+    async def _create_message(self, **kwargs):
+        """Send a Claude request, bounded by the concurrency semaphore."""
+        async with self._sem:
+            return await self.client.messages.create(**kwargs)
+
+    def _get_credibility(self, review: ScrapedReview) -> float:
+        """Credibility weight for a review from its source and engagement."""
         base_credibility = SOURCE_CREDIBILITY.get(review.source_type, 0.5)
 
         # Adjust credibility based on engagement
-        engagement_bonus = 0
-        if review.upvotes:
-            if review.upvotes > 100:
-                engagement_bonus = 0.1
-            elif review.upvotes > 50:
-                engagement_bonus = 0.05
-            elif review.upvotes > 10:
-                engagement_bonus = 0.02
-
-        credibility = min(1.0, base_credibility + engagement_bonus)
+        engagement_bonus = ENGAGEMENT_BONUSES[bisect_left(ENGAGEMENT_THRESHOLDS, review.upvotes or 0)]
+
+        return min(1.0, base_credibility + engagement_bonus)
+
+    def _select_reviews(self, reviews: list[ScrapedReview]) -> list[ScrapedReview]:
+        """Pick up to MAX_ANALYZED_REVIEWS reviews, round-robin across source types."""
+        by_source: dict[str, list[ScrapedReview]] = {}
+        for review in reviews:
+            by_source.setdefault(review.source_type, []).append(review)
+
+        selected = []
+        for group in zip_longest(*by_source.values()):
+            selected.extend(review for review in group if review is not None)
+        return selected[:MAX_ANALYZED_REVIEWS]
+
+    def _chunk_reviews(self, reviews: list[ScrapedReview]) -> list[list[ScrapedReview]]:
+        """Split reviews into batches that fit the per-prompt token budget."""
+        chunks: list[list[ScrapedReview]] = []
+        current: list[ScrapedReview] = []
+        current_tokens = 0
+
+        for review in reviews:
+            # Rough estimate (~4 chars per token) - good enough for budgeting
+            tokens = len(review.content[:MAX_REVIEW_CHARS]) // 4 + 20
+            if current and current_tokens + tokens > BATCH_TOKEN_BUDGET:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(review)
+            current_tokens += tokens
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _cache_key(self, review: ScrapedReview) -> str:
+        """Cache key for a review's analysis, tied to the model and prompt."""
+        raw = ANALYSIS_MODEL + ANALYSIS_PROMPT_VERSION + review.content[:MAX_REVIEW_CHARS]
+        return hashlib.blake2b(raw.encode()).hexdigest()
+
+    async def _request_analyses(
+        self,
+        reviews: list[ScrapedReview],
+        product_name: Optional[str] = None,
+    ) -> tuple[dict[int, dict], Optional[str]]:
+        """Ask Claude to analyze a batch of reviews, keyed by position in the batch.
+
+        If product_name is given, the same request also asks for the summary.
+        """
+        summary_request = ""
+        if product_name:
+            summary_request = f"""
+Also write a 2-sentence summary of user opinions about "{product_name}" across all
+reviews. Be concise and factual. Start with the general consensus.
+"""
+
+        review_blocks = "\n\n".join(
+            f"[[{i}]] source={review.source_type} ({review.source_name})\n"
+            f"{review.content[:MAX_REVIEW_CHARS]}"
+            for i, review in enumerate(reviews)
+        )
 
-        try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=500,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"""Analyze this product review and extract:
+        response = await self._create_message(
+            model=ANALYSIS_MODEL,
+            max_tokens=500 * len(reviews) + (150 if product_name else 0),
+            messages=[
+                {
+                    "role": "user",
+                    "content": f"""Analyze each of the following product reviews and extract:
 1. Overall sentiment (-1.0 very negative to 1.0 very positive)
 2. Top 3 pros mentioned (if any)
 3. Top 3 cons mentioned (if any)
 
-Review from {review.source_name}:
-{review.content[:3000]}
+Each review starts with its id in double brackets, e.g. [[0]].
 
-Respond in JSON format only:
-{{"sentiment": 0.5, "pros": ["pro1", "pro2"], "cons": ["con1"]}}""",
-                    }
-                ],
-            )
+{review_blocks}
+{summary_request}
+Record one analysis per review id with the emit_analysis tool.""",
+                }
+            ],
+            tools=[ANALYSIS_TOOL],
+            tool_choice={"type": "tool", "name": ANALYSIS_TOOL["name"]},
+        )
+
+        data = next(block.input for block in response.content if block.type == "tool_use")
+        summary = (data.get("summary") or "").strip() if product_name else ""
+        return {int(item["id"]): item for item in data.get("analyses", [])}, summary or None
+
+    async def analyze_reviews_batch(
+        self,
+        reviews: list[ScrapedReview],
+        product_name: Optional[str] = None,
+    ) -> tuple[list[ReviewAnalysis], Optional[str]]:
+        """Analyze a batch of reviews for sentiment and key points in one request.
+
+        Returns the analyses and, when product_name is given and no review was
+        served from the cache, a summary generated in the same request.
+        """
+        summary = None
+        analyses: list[Optional[ReviewAnalysis]] = []
+        keys = [self._cache_key(review) for review in reviews]
+        misses: list[int] = []
+
+        for i, (review, key) in enumerate(zip(reviews, keys)):
+            cached = self.cache.get(key)
+            if cached is None:
+                misses.append(i)
+                analyses.append(None)
+            else:
+                analyses.append(
+                    ReviewAnalysis(**cached, credibility_weight=self._get_credibility(review))
+                )
 
-            text = response.content[0].text
-            # Extract JSON from response
-            import json
-            import re
-
-            json_match = re.search(r"\{[^}]+\}", text, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-                return ReviewAnalysis(
-                    sentiment=float(data.get("sentiment", 0)),
-                    pros=data.get("pros", [])[:3],
-                    cons=data.get("cons", [])[:3],
+        if misses:
+            # The merged summary must see every review, so only ask for it when
+            # none were cached; otherwise the caller summarizes the aggregates
+            summary_for = product_name if len(misses) == len(reviews) else None
+            data_by_id: dict[int, dict] = {}
+            try:
+                data_by_id, summary = await self._request_analyses(
+                    [reviews[i] for i in misses], summary_for
+                )
+            except Exception as e:
+                print(f"Review analysis error: {e}")
+
+            for batch_id, i in enumerate(misses):
+                credibility = self._get_credibility(reviews[i])
+                item = data_by_id.get(batch_id)
+                if item is None:
+                    # Default neutral analysis (not cached so it is retried next run)
+                    analyses[i] = ReviewAnalysis(
+                        sentiment=0.0,
+                        pros=[],
+                        cons=[],
+                        credibility_weight=credibility,
+                    )
+                    continue
+
+                analysis = ReviewAnalysis(
+                    sentiment=float(item.get("sentiment", 0)),
+                    pros=item.get("pros", [])[:3],
+                    cons=item.get("cons", [])[:3],
                     credibility_weight=credibility,
                 )
-        except Exception as e:
-            print(f"Review analysis error: {e}")
-
-        # Default neutral analysis
-        return ReviewAnalysis(
-            sentiment=0.0,
-            pros=[],
-            cons=[],
-            credibility_weight=credibility,
-        )
+                result = asdict(analysis)
+                del result["credibility_weight"]
+                self.cache.set(keys[i], result, expire=ANALYSIS_CACHE_TTL)
+                analyses[i] = analysis
+
+        return analyses, summary
 
     async def calculate_rating(
         self,
@@ -133,50 +347,62 @@ Respond in JSON format only:
                 summary="No reviews available for analysis.",
             )
 
-        # Analyze each review
+        # Analyze reviews in batched prompts, concurrently, sampling every
+        # source so the first scrapers' results don't crowd out the rest.
+        # A single batch also produces the summary, saving a second round-trip.
+        chunks = self._chunk_reviews(self._select_reviews(reviews))
+        summary_for = product_name if len(chunks) == 1 else None
+        results = await asyncio.gather(
+            *(self.analyze_reviews_batch(chunk, summary_for) for chunk in chunks),
+            return_exceptions=True,
+        )
         analyses: list[ReviewAnalysis] = []
-        for review in reviews[:20]:  # Limit to 20 reviews
-            analysis = await self.analyze_review(review)
-            analyses.append(analysis)
+        summary = None
+        for result in results:
+            if isinstance(result, BaseException):
+                print(f"Review analysis error: {result}")
+                continue
+            batch_analyses, batch_summary = result
+            analyses.extend(batch_analyses)
+            summary = summary or batch_summary
+
+        sentiments = np.fromiter((a.sentiment for a in analyses), dtype=np.float64, count=len(analyses))
+        weights = np.fromiter(
+            (a.credibility_weight for a in analyses), dtype=np.float64, count=len(analyses)
+        )
 
         # Aggregate sentiment (weighted by credibility)
-        total_weight = sum(a.credibility_weight for a in analyses)
-        if total_weight > 0:
-            sentiment_score = sum(a.sentiment * a.credibility_weight for a in analyses) / total_weight
+        if weights.sum() > 0:
+            sentiment_score = float(np.average(sentiments, weights=weights))
         else:
             sentiment_score = 0.0
 
         # Aggregate pros and cons (count frequency)
-        all_pros: dict[str, int] = {}
-        all_cons: dict[str, int] = {}
+        all_pros: Counter[str] = Counter()
+        all_cons: Counter[str] = Counter()
 
         for analysis in analyses:
-            for pro in analysis.pros:
-                pro_lower = pro.lower().strip()
-                if pro_lower:
-                    all_pros[pro_lower] = all_pros.get(pro_lower, 0) + 1
-            for con in analysis.cons:
-                con_lower = con.lower().strip()
-                if con_lower:
-                    all_cons[con_lower] = all_cons.get(con_lower, 0) + 1
+            all_pros.update(p.lower().strip() for p in analysis.pros if p.strip())
+            all_cons.update(c.lower().strip() for c in analysis.cons if c.strip())
 
         # Get top pros and cons by frequency
-        top_pros = sorted(all_pros.items(), key=lambda x: x[1], reverse=True)[:5]
-        top_cons = sorted(all_cons.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_pros = all_pros.most_common(5)
+        top_cons = all_cons.most_common(5)
 
         # Calculate reliability (consistency of opinions)
-        sentiments = [a.sentiment for a in analyses]
         if len(sentiments) > 1:
-            import statistics
-
-            sentiment_std = statistics.stdev(sentiments)
-            reliability_score = max(0, 1 - sentiment_std)
+            sentiment_std = float(sentiments.std(ddof=1))
+            reliability_score = max(0.0, 1 - sentiment_std)
         else:
             reliability_score = 0.5
 
         # Calculate popularity (based on engagement)
-        total_upvotes = sum(r.upvotes or 0 for r in reviews)
-        total_comments = sum(r.comment_count or 0 for r in reviews)
+        total_upvotes = int(
+            np.fromiter((r.upvotes or 0 for r in reviews), dtype=np.int64, count=len(reviews)).sum()
+        )
+        total_comments = int(
+            np.fromiter((r.comment_count or 0 for r in reviews), dtype=np.int64, count=len(reviews)).sum()
+        )
         popularity_raw = (total_upvotes / 100) + (total_comments / 50)
         popularity_score = min(1.0, popularity_raw / len(reviews))
 
@@ -198,14 +424,23 @@ Respond in JSON format only:
         )
         ai_rating = max(0, min(100, ai_rating))
 
-        # Generate summary
-        summary = await self._generate_summary(
-            product_name,
-            sentiment_score,
-            [p[0] for p in top_pros],
-            [c[0] for c in top_cons],
-            len(reviews),
-        )
+        # Nothing was extracted from any review (e.g. every analysis failed),
+        # so there is nothing for Claude to summarize
+        if not summary and all(a.sentiment == 0.0 and not a.pros and not a.cons for a in analyses):
+            summary = (
+                f"Based on {len(reviews)} sources, there is not enough detail yet to "
+                f"summarize opinions about the {product_name}."
+            )
+
+        # Generate summary unless the analysis request already produced one
+        if not summary:
+            summary = await self._generate_summary(
+                product_name,
+                sentiment_score,
+                [p[0] for p in top_pros],
+                [c[0] for c in top_cons],
+                len(reviews),
+            )
 
         return ProductRating(
             ai_rating=ai_rating,
@@ -242,8 +477,8 @@ Respond in JSON format only:
         )
 
         try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
+            response = await self._create_message(
+                model=ANALYSIS_MODEL,
                 max_tokens=150,
                 messages=[
                     {
@@ -1,8 +1,25 @@
+import importlib
 from .base import BaseScraper, ScrapedReview, ScrapedProduct
-from .reddit import reddit_scraper
-from .youtube import youtube_scraper
-from .review_sites import wirecutter_scraper, rtings_scraper, techradar_scraper
-from .forums import headfi_scraper, avsforum_scraper
+
+# Scraper singletons are imported lazily (PEP 562) so that workers only pay
+# for heavy dependencies like Playwright or asyncpraw when a source is used
+_LAZY = {
+    "reddit_scraper": ".reddit",
+    "youtube_scraper": ".youtube",
+    "wirecutter_scraper": ".review_sites",
+    "rtings_scraper": ".review_sites",
+    "techradar_scraper": ".review_sites",
+    "headfi_scraper": ".forums",
+    "avsforum_scraper": ".forums",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __package__)
+    return getattr(module, name)
+
 
 __all__ = [
     "BaseScraper",
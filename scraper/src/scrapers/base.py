@@ -1,7 +1,31 @@
+import asyncio
+import hashlib
+import json
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from typing import Optional
 from datetime import datetime
+import redis.asyncio as aioredis
+from ..config.settings import get_settings
+
+settings = get_settings()
+
+# Control characters (other than tab and newlines) stripped from content
+_CTRL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Maximum characters of content kept per review
+MAX_CONTENT_LENGTH = 5000
+
+# How long scraped pages are served from the cache, in seconds
+SCRAPE_CACHE_TTL = 86400
+
+# Set within a scrape to bypass cached pages and always fetch fresh content
+bypass_scrape_cache: ContextVar[bool] = ContextVar("bypass_scrape_cache", default=False)
+
+# Redis client for the scrape cache, created on first use
+_cache_client: Optional[aioredis.Redis] = None
 
 
 @dataclass
@@ -34,7 +58,59 @@ class ScrapedProduct:
     brand: Optional[str] = None
 
 
-class BaseScraper(ABC):
+def _get_cache_client() -> aioredis.Redis:
+    """Get the Redis client for the scrape cache, creating it on first use."""
+    global _cache_client
+    if _cache_client is None:
+        _cache_client = aioredis.from_url(settings.redis_url)
+    return _cache_client
+
+
+async def close_scrape_cache() -> None:
+    """Close the scrape cache's Redis connections."""
+    global _cache_client
+    if _cache_client is not None:
+        await _cache_client.aclose()
+        _cache_client = None
+
+
+class CacheMixin:
+    """Caches scrape_url results in Redis so repeated pages are not refetched."""
+
+    async def cached_scrape_url(
+        self, url: str, force_rescrape: bool = False
+    ) -> Optional[ScrapedReview]:
+        """Scrape a URL, serving it from the cache when it was scraped recently."""
+        key = f"scrape:{hashlib.sha1(url.encode()).hexdigest()}"
+        cache = _get_cache_client()
+
+        if not (force_rescrape or bypass_scrape_cache.get()):
+            try:
+                cached = await cache.get(key)
+                if cached:
+                    data = json.loads(cached)
+                    if data["posted_at"]:
+                        data["posted_at"] = datetime.fromisoformat(data["posted_at"])
+                    return ScrapedReview(**data)
+            except Exception as e:
+                print(f"Scrape cache read error: {e}")
+
+        review = await self.scrape_url(url)
+
+        # Failed scrapes are not cached so they are retried next time
+        if review:
+            data = asdict(review)
+            if review.posted_at:
+                data["posted_at"] = review.posted_at.isoformat()
+            try:
+                await cache.setex(key, SCRAPE_CACHE_TTL, json.dumps(data))
+            except Exception as e:
+                print(f"Scrape cache write error: {e}")
+
+        return review
+
+
+class BaseScraper(CacheMixin, ABC):
     """Base class for all scrapers."""
 
     source_type: str = "unknown"
@@ -49,16 +125,33 @@ class BaseScraper(ABC):
         """Scrape a specific URL for review content."""
         pass
 
+    async def scrape_urls(self, urls: list[str], concurrency: int = 8) -> list[ScrapedReview]:
+        """Scrape several URLs concurrently, at most `concurrency` at a time."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scrape_bounded(url: str) -> Optional[ScrapedReview]:
+            async with semaphore:
+                return await self.cached_scrape_url(url)
+
+        results = await asyncio.gather(
+            *(scrape_bounded(url) for url in urls),
+            return_exceptions=True,
+        )
+        return [result for result in results if isinstance(result, ScrapedReview)]
+
     def normalize_content(self, content: str) -> str:
         """Clean and normalize scraped content."""
         if not content:
             return ""
 
-        # Remove excessive whitespace
-        content = " ".join(content.split())
+        # Truncate first so we never normalize more than we keep
+        truncated = len(content) > MAX_CONTENT_LENGTH
+        content = content[:MAX_CONTENT_LENGTH]
+
+        # Remove control characters and excessive whitespace
+        content = " ".join(_CTRL_RE.sub("", content).split())
 
-        # Truncate if too long (keep first 5000 chars)
-        if len(content) > 5000:
-            content = content[:5000] + "..."
+        if truncated:
+            content += "..."
 
         return content
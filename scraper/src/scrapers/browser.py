@@ -0,0 +1,94 @@
+import asyncio
+import os
+from typing import TYPE_CHECKING, Optional
+from ..config.settings import get_settings
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Playwright
+
+settings = get_settings()
+
+# Process-wide Chromium instance shared by all Playwright-based scrapers.
+# Each page load gets its own BrowserContext, which is far cheaper than
+# launching a new browser process per URL.
+_playwright: Optional["Playwright"] = None
+_browser: Optional["Browser"] = None
+_lock = asyncio.Lock()
+
+# Persistent contexts by profile name. Each keeps its profile (HTTP cache,
+# service workers, cookies) on disk, so repeat visits to a site start warm.
+# Chromium allows one process per profile directory, so each prefork pool
+# slot gets its own copy of a profile, reused by whichever process fills it.
+_persistent_contexts: dict[str, "BrowserContext"] = {}
+
+
+async def get_browser() -> "Browser":
+    """Get the shared headless browser, launching it on first use."""
+    global _playwright, _browser
+
+    # Imported lazily so workers that never render pages skip loading Playwright
+    from playwright.async_api import async_playwright
+
+    async with _lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+
+    return _browser
+
+
+def _pool_slot() -> int:
+    """Index of this process's slot in the Celery prefork pool (0 outside a pool).
+
+    Stable across worker restarts, unlike the PID, so profiles stay warm and
+    don't pile up on disk.
+    """
+    from billiard.process import current_process
+
+    return getattr(current_process(), "index", None) or 0
+
+
+async def get_persistent_context(profile: str) -> "BrowserContext":
+    """Get a browser context backed by an on-disk profile, launching it on first use."""
+    global _playwright
+
+    from playwright.async_api import async_playwright
+
+    async with _lock:
+        if profile not in _persistent_contexts:
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            context = await _playwright.chromium.launch_persistent_context(
+                os.path.join(settings.playwright_profile_dir, f"{profile}-{_pool_slot()}"),
+                headless=True,
+            )
+
+            # Forget the context if it closes or Chromium crashes, so the
+            # next call relaunches it instead of reusing a dead one
+            def forget(closed_context, profile=profile):
+                if _persistent_contexts.get(profile) is closed_context:
+                    del _persistent_contexts[profile]
+
+            context.on("close", forget)
+            _persistent_contexts[profile] = context
+
+    return _persistent_contexts[profile]
+
+
+async def close_browser() -> None:
+    """Close the shared browser and persistent contexts, and stop Playwright."""
+    global _playwright, _browser
+
+    async with _lock:
+        # Closing fires each context's close handler, which removes it
+        for context in list(_persistent_contexts.values()):
+            await context.close()
+        _persistent_contexts.clear()
+
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
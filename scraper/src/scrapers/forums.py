@@ -1,8 +1,12 @@
-import httpx
 from typing import Optional
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+from bs4 import BeautifulSoup, SoupStrainer
 from .base import BaseScraper, ScrapedReview
+from .browser import get_browser
+from .http_client import http_client
+
+# Thread pages (XenForo) keep the title in an <h1> and each post in an
+# <article>; parsing only those skips building nav, sidebar and footer trees
+THREAD_STRAINER = SoupStrainer(["h1", "article"])
 
 
 class HeadFiScraper(BaseScraper):
@@ -16,9 +20,10 @@ class HeadFiScraper(BaseScraper):
         reviews = []
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+            browser = await get_browser()
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
 
                 # Search Head-Fi
                 search_url = f"{self.base_url}/search/?q={query.replace(' ', '+')}&t=post&o=relevance"
@@ -33,16 +38,11 @@ class HeadFiScraper(BaseScraper):
                     if href:
                         full_url = href if href.startswith("http") else f"{self.base_url}{href}"
                         urls_seen.add(full_url)
+            finally:
+                await context.close()
 
-                await browser.close()
-
-                # Scrape each thread
-                for url in urls_seen:
-                    review = await self.scrape_url(url)
-                    if review:
-                        reviews.append(review)
-                        if len(reviews) >= limit:
-                            break
+            # Scrape threads concurrently
+            reviews = (await self.scrape_urls(list(urls_seen)))[:limit]
 
         except Exception as e:
             print(f"Head-Fi search error: {e}")
@@ -52,9 +52,61 @@ class HeadFiScraper(BaseScraper):
     async def scrape_url(self, url: str) -> Optional[ScrapedReview]:
         """Scrape a specific Head-Fi thread URL."""
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+            # Thread pages are server-rendered, so a plain HTTP fetch is enough
+            response = await http_client.get(url)
+
+            # Fall back to a real browser when blocked (e.g. bot protection)
+            if response.status_code == 403:
+                return await self._scrape_url_browser(url)
+
+            if response.status_code != 200:
+                return None
+
+            soup = BeautifulSoup(response.content, "lxml", parse_only=THREAD_STRAINER)
+
+            # Get thread title
+            title_el = soup.select_one("h1.p-title-value")
+            title = title_el.get_text(strip=True) if title_el else ""
+
+            content_parts = [f"Thread: {title}"]
+
+            # Get posts
+            posts = soup.select(".message-body .bbWrapper")
+            total_likes = 0
+
+            for i, post in enumerate(posts[:10]):
+                text = post.get_text("\n", strip=True)
+                if len(text) > 50:
+                    content_parts.append(f"Post {i+1}: {text[:800]}")
+
+                # Try to get likes/reactions
+                likes_el = post.select_one("[class*='reaction']")
+                if likes_el:
+                    likes_text = likes_el.get_text(strip=True)
+                    total_likes += int("".join(filter(str.isdigit, likes_text)) or 0)
+
+            if len(content_parts) < 2:
+                return None
+
+            return ScrapedReview(
+                source_type=self.source_type,
+                source_url=url,
+                source_name="Head-Fi",
+                content=self.normalize_content("\n\n".join(content_parts)),
+                upvotes=total_likes if total_likes > 0 else None,
+            )
+
+        except Exception as e:
+            print(f"Head-Fi URL scrape error: {e}")
+            return None
+
+    async def _scrape_url_browser(self, url: str) -> Optional[ScrapedReview]:
+        """Scrape a Head-Fi thread URL with a headless browser."""
+        try:
+            browser = await get_browser()
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
 
                 await page.goto(url, wait_until="networkidle")
 
@@ -82,22 +134,22 @@ class HeadFiScraper(BaseScraper):
                             total_likes += likes
                     except Exception:
                         pass
+            finally:
+                await context.close()
 
-                await browser.close()
-
-                if len(content_parts) < 2:
-                    return None
+            if len(content_parts) < 2:
+                return None
 
-                return ScrapedReview(
-                    source_type=self.source_type,
-                    source_url=url,
-                    source_name="Head-Fi",
-                    content=self.normalize_content("\n\n".join(content_parts)),
-                    upvotes=total_likes if total_likes > 0 else None,
-                )
+            return ScrapedReview(
+                source_type=self.source_type,
+                source_url=url,
+                source_name="Head-Fi",
+                content=self.normalize_content("\n\n".join(content_parts)),
+                upvotes=total_likes if total_likes > 0 else None,
+            )
 
         except Exception as e:
-            print(f"Head-Fi URL scrape error: {e}")
+            print(f"Head-Fi browser scrape error: {e}")
             return None
 
 
@@ -112,9 +164,10 @@ class AVSForumScraper(BaseScraper):
         reviews = []
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+            browser = await get_browser()
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
 
                 # Search AVSForum
                 search_url = f"{self.base_url}/search/?q={query.replace(' ', '+')}&t=post&o=relevance"
@@ -129,15 +182,11 @@ class AVSForumScraper(BaseScraper):
                     if href:
                         full_url = href if href.startswith("http") else f"{self.base_url}{href}"
                         urls_seen.add(full_url)
+            finally:
+                await context.close()
 
-                await browser.close()
-
-                for url in urls_seen:
-                    review = await self.scrape_url(url)
-                    if review:
-                        reviews.append(review)
-                        if len(reviews) >= limit:
-                            break
+            # Scrape threads concurrently
+            reviews = (await self.scrape_urls(list(urls_seen)))[:limit]
 
         except Exception as e:
             print(f"AVSForum search error: {e}")
@@ -147,9 +196,53 @@ class AVSForumScraper(BaseScraper):
     async def scrape_url(self, url: str) -> Optional[ScrapedReview]:
         """Scrape a specific AVSForum thread URL."""
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+            # Thread pages are server-rendered, so a plain HTTP fetch is enough
+            response = await http_client.get(url)
+
+            # Fall back to a real browser when blocked (e.g. bot protection)
+            if response.status_code == 403:
+                return await self._scrape_url_browser(url)
+
+            if response.status_code != 200:
+                return None
+
+            soup = BeautifulSoup(response.content, "lxml", parse_only=THREAD_STRAINER)
+
+            # Get thread title
+            title_el = soup.select_one("h1.p-title-value")
+            title = title_el.get_text(strip=True) if title_el else ""
+
+            content_parts = [f"Thread: {title}"]
+
+            # Get posts
+            posts = soup.select(".message-body .bbWrapper")
+
+            for i, post in enumerate(posts[:10]):
+                text = post.get_text("\n", strip=True)
+                if len(text) > 50:
+                    content_parts.append(f"Post {i+1}: {text[:800]}")
+
+            if len(content_parts) < 2:
+                return None
+
+            return ScrapedReview(
+                source_type=self.source_type,
+                source_url=url,
+                source_name="AVSForum",
+                content=self.normalize_content("\n\n".join(content_parts)),
+            )
+
+        except Exception as e:
+            print(f"AVSForum URL scrape error: {e}")
+            return None
+
+    async def _scrape_url_browser(self, url: str) -> Optional[ScrapedReview]:
+        """Scrape an AVSForum thread URL with a headless browser."""
+        try:
+            browser = await get_browser()
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
 
                 await page.goto(url, wait_until="networkidle")
 
@@ -166,21 +259,21 @@ class AVSForumScraper(BaseScraper):
                     text = await post.inner_text()
                     if len(text) > 50:
                         content_parts.append(f"Post {i+1}: {text[:800]}")
+            finally:
+                await context.close()
 
-                await browser.close()
+            if len(content_parts) < 2:
+                return None
 
-                if len(content_parts) < 2:
-                    return None
-
-                return ScrapedReview(
-                    source_type=self.source_type,
-                    source_url=url,
-                    source_name="AVSForum",
-                    content=self.normalize_content("\n\n".join(content_parts)),
-                )
+            return ScrapedReview(
+                source_type=self.source_type,
+                source_url=url,
+                source_name="AVSForum",
+                content=self.normalize_content("\n\n".join(content_parts)),
+            )
 
         except Exception as e:
-            print(f"AVSForum URL scrape error: {e}")
+            print(f"AVSForum browser scrape error: {e}")
             return None
 
 
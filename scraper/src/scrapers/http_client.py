@@ -0,0 +1,18 @@
+import httpx
+
+USER_AGENT = "Mozilla/5.0 (compatible; Shopii/1.0)"
+
+# Process-wide HTTP client shared by all scrapers, so connections (and
+# HTTP/2 streams) are reused instead of paying a TLS handshake per request
+http_client = httpx.AsyncClient(
+    http2=True,
+    headers={"User-Agent": USER_AGENT},
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=httpx.Timeout(15.0, connect=5.0),
+)
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its connection pool."""
+    await http_client.aclose()
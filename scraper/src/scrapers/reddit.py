@@ -1,7 +1,10 @@
-import praw
+import asyncio
+import time
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 from .base import BaseScraper, ScrapedReview
+from .http_client import http_client
 from ..config.settings import get_settings
 
 settings = get_settings()
@@ -59,6 +62,26 @@ GENERAL_SUBREDDITS = [
     "AmazonTopRated",
 ]
 
+# Query keywords that map to each subreddit category
+_KEYWORD_MAPPING: dict[str, tuple[str, ...]] = {
+    "electronics": ("phone", "laptop", "computer", "tech", "electronic"),
+    "headphones": ("headphone", "earphone", "earbud", "audio", "speaker"),
+    "keyboards": ("keyboard", "keycap", "switch", "mechanical"),
+    "gaming": ("gaming", "game", "pc", "console", "monitor"),
+    "home": ("kitchen", "home", "appliance", "furniture"),
+    "fashion": ("shoe", "clothing", "jacket", "boot", "sneaker"),
+    "fitness": ("gym", "fitness", "workout", "exercise", "running"),
+}
+
+_CATEGORY_SETS: dict[str, frozenset[str]] = {
+    category: frozenset(subreddits) for category, subreddits in CATEGORY_SUBREDDITS.items()
+}
+
+_GENERAL_SET = frozenset(GENERAL_SUBREDDITS)
+
+REDDIT_TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+REDDIT_API_URL = "https://oauth.reddit.com"
+
 
 class RedditScraper(BaseScraper):
     """Scraper for Reddit discussions about products."""
@@ -66,40 +89,125 @@ class RedditScraper(BaseScraper):
     source_type = "reddit"
 
     def __init__(self):
-        self.reddit = None
-        if settings.reddit_client_id and settings.reddit_client_secret:
-            self.reddit = praw.Reddit(
-                client_id=settings.reddit_client_id,
-                client_secret=settings.reddit_client_secret,
-                user_agent=settings.reddit_user_agent,
-            )
+        self.enabled = bool(settings.reddit_client_id and settings.reddit_client_secret)
+        # asyncpraw client for scrape_url, created on first use
+        self._reddit = None
 
-    def _get_subreddits_for_query(self, query: str) -> list[str]:
+        # OAuth token for read-only searches against Reddit's JSON API
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _get_subreddits_for_query(query: str) -> frozenset[str]:
         """Determine relevant subreddits based on query."""
         query_lower = query.lower()
 
-        subreddits = set(GENERAL_SUBREDDITS)
+        subreddits = set(_GENERAL_SET)
 
         # Add category-specific subreddits based on keywords
-        keyword_mapping = {
-            "electronics": ["phone", "laptop", "computer", "tech", "electronic"],
-            "headphones": ["headphone", "earphone", "earbud", "audio", "speaker"],
-            "keyboards": ["keyboard", "keycap", "switch", "mechanical"],
-            "gaming": ["gaming", "game", "pc", "console", "monitor"],
-            "home": ["kitchen", "home", "appliance", "furniture"],
-            "fashion": ["shoe", "clothing", "jacket", "boot", "sneaker"],
-            "fitness": ["gym", "fitness", "workout", "exercise", "running"],
-        }
-
-        for category, keywords in keyword_mapping.items():
+        for category, keywords in _KEYWORD_MAPPING.items():
             if any(kw in query_lower for kw in keywords):
-                subreddits.update(CATEGORY_SUBREDDITS.get(category, []))
+                subreddits |= _CATEGORY_SETS.get(category, frozenset())
+
+        return frozenset(subreddits)
+
+    def _get_reddit(self):
+        """Get the asyncpraw client, importing and creating it on first use."""
+        if self._reddit is None:
+            import asyncpraw
 
-        return list(subreddits)
+            self._reddit = asyncpraw.Reddit(
+                client_id=settings.reddit_client_id,
+                client_secret=settings.reddit_client_secret,
+                user_agent=settings.reddit_user_agent,
+            )
+        return self._reddit
+
+    async def _get_token(self) -> str:
+        """Get an application-only OAuth token, refreshing it when expired."""
+        if self._token and time.monotonic() < self._token_expires_at:
+            return self._token
+
+        response = await http_client.post(
+            REDDIT_TOKEN_URL,
+            data={"grant_type": "client_credentials"},
+            auth=(settings.reddit_client_id, settings.reddit_client_secret),
+            headers={"User-Agent": settings.reddit_user_agent},
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        self._token = data["access_token"]
+        # Refresh a minute early to avoid using a token as it expires
+        self._token_expires_at = time.monotonic() + data.get("expires_in", 3600) - 60
+        return self._token
+
+    async def _api_get(self, path: str, params: dict) -> dict | list:
+        """GET a Reddit API endpoint with OAuth."""
+        token = await self._get_token()
+        response = await http_client.get(
+            f"{REDDIT_API_URL}{path}",
+            params={**params, "raw_json": 1},
+            headers={
+                "Authorization": f"bearer {token}",
+                "User-Agent": settings.reddit_user_agent,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _search_json(self, query: str, limit: int) -> list[dict]:
+        """Search all of Reddit, returning raw post data."""
+        data = await self._api_get(
+            "/r/all/search",
+            {"q": query, "sort": "relevance", "t": "all", "limit": limit},
+        )
+        return [child["data"] for child in data["data"]["children"]]
+
+    async def _fetch_comments_json(self, post: dict) -> list[dict]:
+        """Fetch the top-level comments of a post, returning raw comment data."""
+        if not post.get("num_comments"):
+            return []
+
+        try:
+            data = await self._api_get(
+                f"/comments/{post['id']}",
+                {"limit": 10, "depth": 1},
+            )
+        except Exception:
+            return []
+
+        # Response is [post listing, comment listing]; skip "load more" stubs
+        return [
+            child["data"] for child in data[1]["data"]["children"] if child["kind"] == "t1"
+        ][:10]
+
+    def _format_content(
+        self,
+        title: str,
+        selftext: str,
+        comments: list[tuple[int, str]],
+    ) -> str:
+        """Format a post and its (score, body) comments as review content."""
+        content_parts = []
+
+        # Add post title
+        content_parts.append(f"Title: {title}")
+
+        # Add post body if it's a self post
+        if selftext:
+            content_parts.append(f"Post: {selftext[:2000]}")
+
+        for score, body in comments:
+            if body and score > 1:
+                content_parts.append(f"Comment ({score} upvotes): {body[:500]}")
+
+        return "\n\n".join(content_parts)
 
     async def search(self, query: str, limit: int = 20) -> list[ScrapedReview]:
         """Search Reddit for discussions about a product."""
-        if not self.reddit:
+        if not self.enabled:
             return []
 
         reviews = []
@@ -108,76 +216,78 @@ class RedditScraper(BaseScraper):
         # Search across relevant subreddits
         try:
             # Search all of Reddit first
-            search_results = self.reddit.subreddit("all").search(
-                query,
-                sort="relevance",
-                time_filter="all",
-                limit=limit,
-            )
-
-            for post in search_results:
-                # Skip posts from irrelevant subreddits
-                if post.subreddit.display_name not in subreddits and len(reviews) >= limit // 2:
+            posts = []
+            for post in await self._search_json(query, limit):
+                # Skip downvoted posts and posts from irrelevant subreddits
+                # before any comments are fetched for them
+                if post["score"] <= 0:
                     continue
-
-                content = self._extract_post_content(post)
-                if not content:
+                if post["subreddit"] not in subreddits and len(posts) >= limit // 2:
                     continue
+                posts.append(post)
+
+            # Fetch comments for all posts concurrently
+            all_comments = await asyncio.gather(
+                *(self._fetch_comments_json(post) for post in posts)
+            )
+
+            for post, comments in zip(posts, all_comments):
+                content = self._format_content(
+                    post["title"],
+                    post["selftext"] if post.get("is_self") else "",
+                    [(comment["score"], comment.get("body", "")) for comment in comments],
+                )
 
+                author = post.get("author")
                 review = ScrapedReview(
                     source_type=self.source_type,
-                    source_url=f"https://reddit.com{post.permalink}",
-                    source_name=f"r/{post.subreddit.display_name}",
+                    source_url=f"https://reddit.com{post['permalink']}",
+                    source_name=f"r/{post['subreddit']}",
                     content=self.normalize_content(content),
-                    upvotes=post.score,
-                    comment_count=post.num_comments,
-                    author=post.author.name if post.author else None,
-                    posted_at=datetime.fromtimestamp(post.created_utc),
+                    upvotes=post["score"],
+                    comment_count=post["num_comments"],
+                    author=author if author and author != "[deleted]" else None,
+                    posted_at=datetime.fromtimestamp(post["created_utc"]),
                 )
                 reviews.append(review)
 
-                if len(reviews) >= limit:
-                    break
-
         except Exception as e:
             print(f"Reddit search error: {e}")
 
         return reviews
 
-    def _extract_post_content(self, post) -> str:
-        """Extract meaningful content from a Reddit post."""
-        content_parts = []
-
-        # Add post title
-        content_parts.append(f"Title: {post.title}")
-
-        # Add post body if it's a self post
-        if post.is_self and post.selftext:
-            content_parts.append(f"Post: {post.selftext[:2000]}")
-
-        # Get top comments
-        try:
-            post.comments.replace_more(limit=0)
-            top_comments = post.comments[:10]
-
-            for comment in top_comments:
-                if hasattr(comment, "body") and comment.body and comment.score > 1:
-                    content_parts.append(f"Comment ({comment.score} upvotes): {comment.body[:500]}")
-        except Exception:
-            pass
-
-        return "\n\n".join(content_parts)
+    async def _extract_post_content(self, submission) -> str:
+        """Extract meaningful content from a fetched PRAW submission."""
+        comments = []
+
+        # Get top comments (skip the fetch when there are none)
+        if submission.num_comments:
+            try:
+                await submission.comments.replace_more(limit=0)
+                comments = [
+                    (comment.score, comment.body)
+                    for comment in submission.comments[:10]
+                    if hasattr(comment, "body")
+                ]
+            except Exception:
+                pass
+
+        return self._format_content(
+            submission.title,
+            submission.selftext if submission.is_self else "",
+            comments,
+        )
 
     async def scrape_url(self, url: str) -> Optional[ScrapedReview]:
         """Scrape a specific Reddit post URL."""
-        if not self.reddit:
+        if not self.enabled:
             return None
 
         try:
             # Extract post ID from URL
-            submission = self.reddit.submission(url=url)
+            submission = await self._get_reddit().submission(url=url)
 
-            content = self._extract_post_content(submission)
+            content = await self._extract_post_content(submission)
             if not content:
                 return None
 
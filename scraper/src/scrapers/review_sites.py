@@ -1,13 +1,165 @@
-import httpx
-from typing import Optional
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+import io
+from typing import Callable, Optional
+from urllib.parse import urlparse
+from lxml import etree, html as lxml_html
+from lxml.etree import XPath
 from .base import BaseScraper, ScrapedReview
+from .browser import get_persistent_context
+from .http_client import http_client
 from ..config.settings import get_settings
 
 settings = get_settings()
 
 
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements with an exact CSS class."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Precompiled XPath queries, shared across all page parses
+TITLE_XP = XPath("(//h1)[1]")
+
+WIRECUTTER_ARTICLE_LINKS_XP = XPath("//article//a[contains(@href, '/reviews/')]/@href")
+
+RTINGS_SCORE_XP = XPath("(//*[contains(@class, 'score') or contains(@class, 'rating')])[1]")
+RTINGS_VERDICT_XP = XPath("(//*[contains(@class, 'verdict') or contains(@class, 'summary')])[1]")
+RTINGS_PROS_XP = XPath("//*[contains(@class, 'pros') or contains(@class, 'positive')]//li")
+RTINGS_CONS_XP = XPath("//*[contains(@class, 'cons') or contains(@class, 'negative')]//li")
+RTINGS_PARAGRAPHS_XP = XPath(f"//article//p | //*[{_has_class('review-body')}]//p")
+
+TECHRADAR_REVIEW_LINKS_XP = XPath("//a[contains(@href, '/reviews/')]/@href")
+
+
+def _text(element) -> str:
+    """Stripped text content of an element."""
+    return element.text_content().strip()
+
+
+def _class_contains(element, *names: str) -> bool:
+    """Whether an element's class attribute contains any of the substrings."""
+    cls = element.get("class") or ""
+    return any(name in cls for name in names)
+
+
+def _has_class_name(element, name: str) -> bool:
+    """Whether an element has an exact CSS class."""
+    return name in (element.get("class") or "").split()
+
+
+def _within(element, matches: Callable) -> bool:
+    """Whether any ancestor of an element satisfies the predicate."""
+    return any(matches(ancestor) for ancestor in element.iterancestors())
+
+
+def _is_title(element) -> bool:
+    return element.tag == "h1"
+
+
+def _is_article(element) -> bool:
+    return element.tag == "article"
+
+
+def _is_wirecutter_paragraph(element) -> bool:
+    return element.tag == "p" and _within(element, _is_article)
+
+
+def _is_wirecutter_pick(element) -> bool:
+    return _class_contains(element, "pick", "recommendation")
+
+
+def _is_techradar_rating(element) -> bool:
+    return _class_contains(element, "rating", "score")
+
+
+def _is_techradar_verdict(element) -> bool:
+    return _class_contains(element, "verdict") or _has_class_name(element, "article__summary")
+
+
+def _is_techradar_for_against(element) -> bool:
+    return element.tag == "li" and _within(
+        element, lambda a: _class_contains(a, "for-against", "pros-cons")
+    )
+
+
+def _is_techradar_paragraph(element) -> bool:
+    return element.tag == "p" and _within(
+        element, lambda a: _is_article(a) or _has_class_name(a, "body-copy")
+    )
+
+
+def _stream_extract(
+    content: bytes,
+    fields: dict[str, tuple[Callable, int]],
+) -> dict[str, list[str]]:
+    """Stream-parse an HTML page, collecting the text of matching elements.
+
+    Each field maps to a predicate, checked in document order as elements
+    open, and the maximum number of matches to collect. Subtrees that no
+    pending match needs are freed as soon as they close, and parsing stops
+    once every field is full.
+    """
+    results = {name: [] for name in fields}
+    remaining = {name: limit for name, (_, limit) in fields.items()}
+    # Matched elements still being parsed, with the result slots they fill
+    pending: dict = {}
+
+    events = etree.iterparse(io.BytesIO(content), events=("start", "end"), html=True)
+    for event, element in events:
+        if event == "start":
+            for name, (matches, _) in fields.items():
+                if remaining[name] and matches(element):
+                    remaining[name] -= 1
+                    results[name].append("")
+                    pending.setdefault(element, []).append((name, len(results[name]) - 1))
+            continue
+
+        for name, index in pending.pop(element, ()):
+            results[name][index] = "".join(element.itertext()).strip()
+
+        if not pending:
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+            if not any(remaining.values()):
+                break
+
+    return results
+
+
+# Resources RTINGS pages don't need for their review content; blocking them
+# keeps ads, trackers and fonts from slowing down page loads
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+async def _block_resources(route) -> None:
+    """Playwright route handler aborting requests for unneeded resources."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# How long to wait for RTINGS search results or a review heading to render
+RTINGS_RENDER_TIMEOUT_MS = 5000
+
+
+# Streamed fields of article pages: (predicate, maximum matches)
+WIRECUTTER_FIELDS = {
+    "title": (_is_title, 1),
+    "paragraphs": (_is_wirecutter_paragraph, 20),
+    "picks": (_is_wirecutter_pick, 5),
+}
+
+TECHRADAR_FIELDS = {
+    "title": (_is_title, 1),
+    "rating": (_is_techradar_rating, 1),
+    "verdict": (_is_techradar_verdict, 1),
+    "for_against": (_is_techradar_for_against, 10),
+    "paragraphs": (_is_techradar_paragraph, 15),
+}
+
+
 class WirecutterScraper(BaseScraper):
     """Scraper for Wirecutter (NYT) product reviews."""
 
@@ -19,31 +171,25 @@ class WirecutterScraper(BaseScraper):
         reviews = []
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Search Wirecutter
-                search_url = f"{self.base_url}/search/?s={query.replace(' ', '+')}"
-                response = await client.get(
-                    search_url,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; Shopii/1.0)"},
-                    follow_redirects=True,
-                )
-
-                if response.status_code != 200:
-                    return reviews
+            # Search Wirecutter
+            search_url = f"{self.base_url}/search/?s={query.replace(' ', '+')}"
+            response = await http_client.get(search_url)
+
+            if response.status_code != 200:
+                return reviews
 
-                soup = BeautifulSoup(response.text, "lxml")
+            tree = lxml_html.fromstring(response.content)
 
-                # Find article links
-                articles = soup.select("article a[href*='/reviews/']")[:limit]
+            # Find article links
+            articles = WIRECUTTER_ARTICLE_LINKS_XP(tree)[:limit]
 
-                for article in articles:
-                    url = article.get("href", "")
-                    if not url.startswith("http"):
-                        url = f"https://www.nytimes.com{url}"
+            urls = [
+                url if url.startswith("http") else f"https://www.nytimes.com{url}"
+                for url in articles
+            ]
 
-                    review = await self.scrape_url(url)
-                    if review:
-                        reviews.append(review)
+            # Scrape articles concurrently
+            reviews = await self.scrape_urls(urls)
 
         except Exception as e:
             print(f"Wirecutter search error: {e}")
@@ -53,48 +199,37 @@ class WirecutterScraper(BaseScraper):
     async def scrape_url(self, url: str) -> Optional[ScrapedReview]:
         """Scrape a specific Wirecutter review URL."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; Shopii/1.0)"},
-                    follow_redirects=True,
-                )
-
-                if response.status_code != 200:
-                    return None
-
-                soup = BeautifulSoup(response.text, "lxml")
-
-                # Extract title
-                title = soup.select_one("h1")
-                title_text = title.get_text(strip=True) if title else ""
-
-                # Extract article content
-                content_parts = [f"Article: {title_text}"]
-
-                # Get main article paragraphs
-                paragraphs = soup.select("article p")[:20]
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if len(text) > 50:  # Skip short paragraphs
-                        content_parts.append(text)
-
-                # Look for "Our pick" or recommendations
-                picks = soup.select("[class*='pick'], [class*='recommendation']")
-                for pick in picks[:5]:
-                    text = pick.get_text(strip=True)
-                    if text:
-                        content_parts.append(f"Recommendation: {text}")
-
-                if len(content_parts) < 2:
-                    return None
-
-                return ScrapedReview(
-                    source_type=self.source_type,
-                    source_url=url,
-                    source_name="Wirecutter",
-                    content=self.normalize_content("\n\n".join(content_parts)),
-                )
+            response = await http_client.get(url)
+
+            if response.status_code != 200:
+                return None
+
+            # Article pages are large; stream them and stop once we have enough
+            extracted = _stream_extract(response.content, WIRECUTTER_FIELDS)
+
+            # Extract article content
+            title_text = extracted["title"][0] if extracted["title"] else ""
+            content_parts = [f"Article: {title_text}"]
+
+            # Get main article paragraphs
+            for text in extracted["paragraphs"]:
+                if len(text) > 50:  # Skip short paragraphs
+                    content_parts.append(text)
+
+            # Look for "Our pick" or recommendations
+            for text in extracted["picks"]:
+                if text:
+                    content_parts.append(f"Recommendation: {text}")
+
+            if len(content_parts) < 2:
+                return None
+
+            return ScrapedReview(
+                source_type=self.source_type,
+                source_url=url,
+                source_name="Wirecutter",
+                content=self.normalize_content("\n\n".join(content_parts)),
+            )
 
         except Exception as e:
             print(f"Wirecutter URL scrape error: {e}")
@@ -107,18 +242,82 @@ class RTINGSScraper(BaseScraper):
     source_type = "rtings"
     base_url = "https://www.rtings.com"
 
+    def __init__(self):
+        # Review sections (first path segment) whose pages need JS to render
+        self._js_sections: set[str] = set()
+        # Context the resource-blocking route was installed on
+        self._routed_context = None
+
+    async def _get_context(self):
+        """Get the persistent RTINGS browser context, with resource blocking."""
+        context = await get_persistent_context("rtings")
+        if context is not self._routed_context:
+            await context.route("**/*", _block_resources)
+            self._routed_context = context
+            context.on("close", self._on_context_close)
+        return context
+
+    def _on_context_close(self, context) -> None:
+        """Drop a closed context so a relaunched one gets resource blocking again."""
+        if self._routed_context is context:
+            self._routed_context = None
+
+    def _section(self, url: str) -> str:
+        """Review section of an RTINGS URL, e.g. "headphones"."""
+        return urlparse(url).path.strip("/").split("/", 1)[0]
+
+    def _extract_content(self, tree) -> list[str]:
+        """Extract the review content parts from a parsed RTINGS page."""
+        title = TITLE_XP(tree)
+        content_parts = [f"Review: {_text(title[0]) if title else ''}"]
+
+        # Extract overall score
+        score = RTINGS_SCORE_XP(tree)
+        if score:
+            content_parts.append(f"Score: {_text(score[0])}")
+
+        # Get verdict/summary
+        verdict = RTINGS_VERDICT_XP(tree)
+        if verdict:
+            content_parts.append(f"Verdict: {_text(verdict[0])}")
+
+        # Get pros and cons
+        pros = [_text(el) for el in RTINGS_PROS_XP(tree)[:5]]
+        if pros:
+            content_parts.append(f"Pros: {', '.join(pros)}")
+
+        cons = [_text(el) for el in RTINGS_CONS_XP(tree)[:5]]
+        if cons:
+            content_parts.append(f"Cons: {', '.join(cons)}")
+
+        # Get main content paragraphs
+        for p in RTINGS_PARAGRAPHS_XP(tree)[:10]:
+            text = _text(p)
+            if len(text) > 100:
+                content_parts.append(text)
+
+        return content_parts
+
     async def search(self, query: str, limit: int = 5) -> list[ScrapedReview]:
         """Search RTINGS for product reviews."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
         reviews = []
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-
-                # Go to RTINGS search
+            context = await self._get_context()
+            page = await context.new_page()
+            try:
+                # Go to RTINGS search, waiting for results rather than network idle
                 search_url = f"{self.base_url}/search?query={query.replace(' ', '+')}"
-                await page.goto(search_url, wait_until="networkidle")
+                await page.goto(search_url, wait_until="domcontentloaded")
+                try:
+                    await page.wait_for_selector(
+                        "a[href*='/reviews/']", timeout=RTINGS_RENDER_TIMEOUT_MS
+                    )
+                except PlaywrightTimeoutError:
+                    # No review links rendered: RTINGS has nothing for this query
+                    return reviews
 
                 # Get review links
                 links = await page.query_selector_all("a[href*='/reviews/']")
@@ -130,14 +329,11 @@ class RTINGSScraper(BaseScraper):
                         full_url = href if href.startswith("http") else f"{self.base_url}{href}"
                         if full_url not in urls_seen:
                             urls_seen.add(full_url)
+            finally:
+                await page.close()
 
-                await browser.close()
-
-                # Scrape each review URL
-                for url in list(urls_seen)[:limit]:
-                    review = await self.scrape_url(url)
-                    if review:
-                        reviews.append(review)
+            # Scrape reviews concurrently (may fall back to browser pages)
+            reviews = await self.scrape_urls(list(urls_seen)[:limit], concurrency=4)
 
         except Exception as e:
             print(f"RTINGS search error: {e}")
@@ -146,61 +342,65 @@ class RTINGSScraper(BaseScraper):
 
     async def scrape_url(self, url: str) -> Optional[ScrapedReview]:
         """Scrape a specific RTINGS review URL."""
-        try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
-
-                await page.goto(url, wait_until="networkidle")
-
-                # Extract title
-                title_el = await page.query_selector("h1")
-                title = await title_el.inner_text() if title_el else ""
-
-                # Extract overall score
-                score_el = await page.query_selector("[class*='score'], [class*='rating']")
-                score = await score_el.inner_text() if score_el else ""
-
-                content_parts = [f"Review: {title}"]
-                if score:
-                    content_parts.append(f"Score: {score}")
+        section = self._section(url)
+        if section in self._js_sections:
+            return await self._scrape_url_browser(url)
 
-                # Get verdict/summary
-                verdict_el = await page.query_selector("[class*='verdict'], [class*='summary']")
-                if verdict_el:
-                    verdict = await verdict_el.inner_text()
-                    content_parts.append(f"Verdict: {verdict}")
-
-                # Get pros and cons
-                pros_el = await page.query_selector_all("[class*='pros'] li, [class*='positive'] li")
-                cons_el = await page.query_selector_all("[class*='cons'] li, [class*='negative'] li")
-
-                if pros_el:
-                    pros = [await el.inner_text() for el in pros_el[:5]]
-                    content_parts.append(f"Pros: {', '.join(pros)}")
-
-                if cons_el:
-                    cons = [await el.inner_text() for el in cons_el[:5]]
-                    content_parts.append(f"Cons: {', '.join(cons)}")
+        try:
+            # Most review pages are server-rendered, so try a plain fetch first
+            response = await http_client.get(url)
+
+            if response.status_code == 200:
+                tree = lxml_html.fromstring(response.content)
+                if TITLE_XP(tree) and RTINGS_VERDICT_XP(tree):
+                    return ScrapedReview(
+                        source_type=self.source_type,
+                        source_url=url,
+                        source_name="RTINGS",
+                        content=self.normalize_content("\n\n".join(self._extract_content(tree))),
+                    )
+
+                # Key content is rendered client-side; skip the fetch next time
+                self._js_sections.add(section)
 
-                # Get main content paragraphs
-                paragraphs = await page.query_selector_all("article p, .review-body p")
-                for p in paragraphs[:10]:
-                    text = await p.inner_text()
-                    if len(text) > 100:
-                        content_parts.append(text)
+        except Exception as e:
+            print(f"RTINGS URL fetch error, falling back to browser: {e}")
 
-                await browser.close()
+        return await self._scrape_url_browser(url)
 
-                if len(content_parts) < 2:
-                    return None
+    async def _scrape_url_browser(self, url: str) -> Optional[ScrapedReview]:
+        """Scrape an RTINGS review URL with a headless browser."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-                return ScrapedReview(
-                    source_type=self.source_type,
-                    source_url=url,
-                    source_name="RTINGS",
-                    content=self.normalize_content("\n\n".join(content_parts)),
-                )
+        try:
+            context = await self._get_context()
+            page = await context.new_page()
+            try:
+                # Wait for the review itself rather than for ad pixels to settle
+                await page.goto(url, wait_until="domcontentloaded")
+                try:
+                    await page.wait_for_selector("h1", timeout=RTINGS_RENDER_TIMEOUT_MS)
+                except PlaywrightTimeoutError:
+                    # Extract whatever rendered; pages without content return None
+                    pass
+
+                # Pull the rendered DOM once and extract everything with lxml,
+                # instead of one CDP round-trip per selector and element
+                html = await page.content()
+            finally:
+                await page.close()
+
+            content_parts = self._extract_content(lxml_html.fromstring(html))
+
+            if len(content_parts) < 2:
+                return None
+
+            return ScrapedReview(
+                source_type=self.source_type,
+                source_url=url,
+                source_name="RTINGS",
+                content=self.normalize_content("\n\n".join(content_parts)),
+            )
 
         except Exception as e:
             print(f"RTINGS URL scrape error: {e}")
@@ -218,34 +418,26 @@ class TechRadarScraper(BaseScraper):
         reviews = []
 
         try:
-            async with httpx.AsyncClient() as client:
-                search_url = f"{self.base_url}/search?searchTerm={query.replace(' ', '+')}"
-                response = await client.get(
-                    search_url,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; Shopii/1.0)"},
-                    follow_redirects=True,
-                )
-
-                if response.status_code != 200:
-                    return reviews
+            search_url = f"{self.base_url}/search?searchTerm={query.replace(' ', '+')}"
+            response = await http_client.get(search_url)
 
-                soup = BeautifulSoup(response.text, "lxml")
+            if response.status_code != 200:
+                return reviews
 
-                # Find review article links
-                links = soup.select("a[href*='/reviews/']")[:limit * 2]
+            tree = lxml_html.fromstring(response.content)
 
-                urls_seen = set()
-                for link in links:
-                    href = link.get("href", "")
-                    if href and "/reviews/" in href:
-                        full_url = href if href.startswith("http") else f"{self.base_url}{href}"
-                        if full_url not in urls_seen:
-                            urls_seen.add(full_url)
+            # Find review article links
+            links = TECHRADAR_REVIEW_LINKS_XP(tree)[:limit * 2]
+
+            urls_seen = set()
+            for href in links:
+                if href and "/reviews/" in href:
+                    full_url = href if href.startswith("http") else f"{self.base_url}{href}"
+                    if full_url not in urls_seen:
+                        urls_seen.add(full_url)
 
-                for url in list(urls_seen)[:limit]:
-                    review = await self.scrape_url(url)
-                    if review:
-                        reviews.append(review)
+            # Scrape reviews concurrently
+            reviews = await self.scrape_urls(list(urls_seen)[:limit])
 
         except Exception as e:
             print(f"TechRadar search error: {e}")
@@ -255,55 +447,42 @@ class TechRadarScraper(BaseScraper):
     async def scrape_url(self, url: str) -> Optional[ScrapedReview]:
         """Scrape a specific TechRadar review URL."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers={"User-Agent": "Mozilla/5.0 (compatible; Shopii/1.0)"},
-                    follow_redirects=True,
-                )
-
-                if response.status_code != 200:
-                    return None
-
-                soup = BeautifulSoup(response.text, "lxml")
-
-                # Extract title
-                title = soup.select_one("h1")
-                title_text = title.get_text(strip=True) if title else ""
-
-                content_parts = [f"Review: {title_text}"]
-
-                # Extract rating
-                rating = soup.select_one("[class*='rating'], [class*='score']")
-                if rating:
-                    content_parts.append(f"Rating: {rating.get_text(strip=True)}")
-
-                # Extract verdict
-                verdict = soup.select_one("[class*='verdict'], .article__summary")
-                if verdict:
-                    content_parts.append(f"Verdict: {verdict.get_text(strip=True)}")
-
-                # Extract pros and cons
-                for_against = soup.select("[class*='for-against'] li, [class*='pros-cons'] li")
-                for item in for_against[:10]:
-                    content_parts.append(item.get_text(strip=True))
-
-                # Get main content
-                paragraphs = soup.select("article p, .body-copy p")[:15]
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if len(text) > 100:
-                        content_parts.append(text)
-
-                if len(content_parts) < 2:
-                    return None
-
-                return ScrapedReview(
-                    source_type=self.source_type,
-                    source_url=url,
-                    source_name="TechRadar",
-                    content=self.normalize_content("\n\n".join(content_parts)),
-                )
+            response = await http_client.get(url)
+
+            if response.status_code != 200:
+                return None
+
+            # Review pages are large; stream them and stop once we have enough
+            extracted = _stream_extract(response.content, TECHRADAR_FIELDS)
+
+            title_text = extracted["title"][0] if extracted["title"] else ""
+            content_parts = [f"Review: {title_text}"]
+
+            # Extract rating
+            if extracted["rating"]:
+                content_parts.append(f"Rating: {extracted['rating'][0]}")
+
+            # Extract verdict
+            if extracted["verdict"]:
+                content_parts.append(f"Verdict: {extracted['verdict'][0]}")
+
+            # Extract pros and cons
+            content_parts.extend(extracted["for_against"])
+
+            # Get main content
+            for text in extracted["paragraphs"]:
+                if len(text) > 100:
+                    content_parts.append(text)
+
+            if len(content_parts) < 2:
+                return None
+
+            return ScrapedReview(
+                source_type=self.source_type,
+                source_url=url,
+                source_name="TechRadar",
+                content=self.normalize_content("\n\n".join(content_parts)),
+            )
 
         except Exception as e:
             print(f"TechRadar URL scrape error: {e}")
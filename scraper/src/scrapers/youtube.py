@@ -1,3 +1,6 @@
+import asyncio
+import re
+import httplib2
 from typing import Optional
 from datetime import datetime
 from googleapiclient.discovery import build
@@ -6,6 +9,9 @@ from ..config.settings import get_settings
 
 settings = get_settings()
 
+# Video ID in watch, youtu.be, shorts and embed URLs (any host, incl. m.youtube.com)
+_YT_ID_RE = re.compile(r"(?:[?&]v=|youtu\.be/|/shorts/|/embed/)([A-Za-z0-9_-]{11})")
+
 
 class YouTubeScraper(BaseScraper):
     """Scraper for YouTube video comments on product reviews."""
@@ -17,6 +23,13 @@ class YouTubeScraper(BaseScraper):
         if settings.youtube_api_key:
             self.youtube = build("youtube", "v3", developerKey=settings.youtube_api_key)
 
+    async def _execute(self, request) -> dict:
+        """Execute a blocking API request in a worker thread.
+
+        httplib2 is not thread-safe, so each call gets its own Http instance.
+        """
+        return await asyncio.to_thread(request.execute, http=httplib2.Http())
+
     async def search(self, query: str, limit: int = 20) -> list[ScrapedReview]:
         """Search YouTube for review videos and extract comments."""
         if not self.youtube:
@@ -27,31 +40,49 @@ class YouTubeScraper(BaseScraper):
         try:
             # Search for review videos
             search_query = f"{query} review"
-            search_response = self.youtube.search().list(
-                q=search_query,
-                part="id,snippet",
-                maxResults=min(limit, 10),  # Get top 10 videos
-                type="video",
-                order="relevance",
-                relevanceLanguage="en",
-            ).execute()
-
-            for item in search_response.get("items", []):
-                video_id = item["id"]["videoId"]
-                video_title = item["snippet"]["title"]
-                channel_title = item["snippet"]["channelTitle"]
-
-                # Get comments for this video
-                video_reviews = await self._get_video_comments(
-                    video_id,
-                    video_title,
-                    channel_title,
-                    limit=5,  # 5 top comments per video
+            search_response = await self._execute(
+                self.youtube.search().list(
+                    q=search_query,
+                    part="id,snippet",
+                    maxResults=min(limit, 10),  # Get top 10 videos
+                    type="video",
+                    order="relevance",
+                    relevanceLanguage="en",
                 )
-                reviews.extend(video_reviews)
+            )
 
-                if len(reviews) >= limit:
-                    break
+            items = search_response.get("items", [])
+            video_ids = [item["id"]["videoId"] for item in items]
+            if not video_ids:
+                return reviews
+
+            # Get statistics for all videos in a single request
+            videos_response = await self._execute(
+                self.youtube.videos().list(
+                    part="statistics",
+                    id=",".join(video_ids),
+                )
+            )
+            stats_by_id = {
+                video["id"]: video.get("statistics", {})
+                for video in videos_response.get("items", [])
+            }
+
+            # Get comments for all videos concurrently
+            results = await asyncio.gather(
+                *(
+                    self._get_video_comments(
+                        item["id"]["videoId"],
+                        item["snippet"]["title"],
+                        item["snippet"]["channelTitle"],
+                        stats_by_id.get(item["id"]["videoId"], {}),
+                        limit=5,  # 5 top comments per video
+                    )
+                    for item in items
+                )
+            )
+            for video_reviews in results:
+                reviews.extend(video_reviews)
 
         except Exception as e:
             print(f"YouTube search error: {e}")
@@ -63,33 +94,29 @@ class YouTubeScraper(BaseScraper):
         video_id: str,
         video_title: str,
         channel_title: str,
+        video_stats: dict,
         limit: int = 10,
     ) -> list[ScrapedReview]:
-        """Get top comments from a YouTube video."""
+        """Get top comments from a YouTube video, given its prefetched statistics."""
         if not self.youtube:
             return []
 
         reviews = []
 
         try:
-            # Get video statistics
-            video_response = self.youtube.videos().list(
-                part="statistics",
-                id=video_id,
-            ).execute()
-
-            video_stats = video_response.get("items", [{}])[0].get("statistics", {})
             view_count = int(video_stats.get("viewCount", 0))
             like_count = int(video_stats.get("likeCount", 0))
 
             # Get top comments
-            comments_response = self.youtube.commentThreads().list(
-                part="snippet",
-                videoId=video_id,
-                maxResults=limit,
-                order="relevance",
-                textFormat="plainText",
-            ).execute()
+            comments_response = await self._execute(
+                self.youtube.commentThreads().list(
+                    part="snippet",
+                    videoId=video_id,
+                    maxResults=limit,
+                    order="relevance",
+                    textFormat="plainText",
+                )
+            )
 
             # Build content from video info and comments
             content_parts = [
@@ -134,20 +161,18 @@ class YouTubeScraper(BaseScraper):
 
         try:
             # Extract video ID from URL
-            video_id = None
-            if "youtube.com/watch?v=" in url:
-                video_id = url.split("v=")[1].split("&")[0]
-            elif "youtu.be/" in url:
-                video_id = url.split("youtu.be/")[1].split("?")[0]
-
-            if not video_id:
+            match = _YT_ID_RE.search(url)
+            if not match:
                 return None
+            video_id = match.group(1)
 
             # Get video info
-            video_response = self.youtube.videos().list(
-                part="snippet,statistics",
-                id=video_id,
-            ).execute()
+            video_response = await self._execute(
+                self.youtube.videos().list(
+                    part="snippet,statistics",
+                    id=video_id,
+                )
+            )
 
             if not video_response.get("items"):
                 return None
@@ -157,7 +182,7 @@ class YouTubeScraper(BaseScraper):
             channel_title = video["snippet"]["channelTitle"]
 
             reviews = await self._get_video_comments(
-                video_id, video_title, channel_title, limit=20
+                video_id, video_title, channel_title, video.get("statistics", {}), limit=20
             )
 
             return reviews[0] if reviews else None
@@ -1,15 +1,24 @@
 """Celery worker for scraping tasks."""
 from celery import Celery
+from celery.signals import worker_process_shutdown
 from .config.settings import get_settings
 from .config.database import get_db
-from .scrapers.reddit import reddit_scraper
-from .scrapers.youtube import youtube_scraper
-from .scrapers.review_sites import wirecutter_scraper, rtings_scraper, techradar_scraper
-from .scrapers.forums import headfi_scraper, avsforum_scraper
+from . import scrapers as scraper_registry
+from .scrapers.base import bypass_scrape_cache, close_scrape_cache
+from .scrapers.browser import close_browser
+from .scrapers.http_client import close_http_client
+from .processors.dedupe import dedupe_reviews
 from .processors.rating_calculator import rating_calculator
 import asyncio
+import hashlib
+import threading
 from datetime import datetime, timedelta
-from sqlalchemy import text
+from typing import Optional
+from urllib.parse import urlparse
+import zstandard
+from rbloom import Bloom
+from sqlalchemy import column, func, table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 settings = get_settings()
 
@@ -33,14 +42,153 @@ celery_app.conf.update(
 )
 
 
+# Relies on the unique index on review_sources.source_url (sourceUrl is
+# @unique in the Prisma schema), so duplicates are rejected atomically by
+# the server instead of checked with a SELECT first
+INSERT_REVIEW_SQL = text("""
+    INSERT INTO review_sources
+    (product_id, source_type, source_url, source_name, raw_content, upvotes, comment_count, scraped_at)
+    VALUES (:product_id, :source_type, :source_url, :source_name, :raw_content, :upvotes, :comment_count, NOW())
+    ON CONFLICT (source_url) DO NOTHING
+""")
+
+# Lightweight table for building the multi-row review insert
+REVIEW_SOURCES = table(
+    "review_sources",
+    column("product_id"),
+    column("source_type"),
+    column("source_url"),
+    column("source_name"),
+    column("raw_content"),
+    column("upvotes"),
+    column("comment_count"),
+    column("scraped_at"),
+)
+
+
+def _insert_reviews(db, params: list[dict]) -> None:
+    """Insert reviews in one multi-row INSERT ... ON CONFLICT (source_url) DO NOTHING.
+
+    psycopg2 runs executemany as one round trip per row, and SQLAlchemy does
+    not batch text() or ON CONFLICT statements, so build the VALUES list here.
+    """
+    db.execute(
+        pg_insert(REVIEW_SOURCES)
+        .values([{**row, "scraped_at": func.now()} for row in params])
+        .on_conflict_do_nothing(index_elements=["source_url"])
+    )
+
+
+# raw_content is stored zstd-compressed (bytea); scraped prose shrinks 3-5x,
+# which cuts wire, WAL and TOAST traffic on every insert
+_compressor = zstandard.ZstdCompressor(level=3)
+
+
+def _compress_content(content: str) -> bytes:
+    """Compress review content for the raw_content column."""
+    return _compressor.compress(content.encode())
+
+
+# Bloom filters of review URLs and content digests already stored, loaded
+# from the database once per worker process so duplicate reviews are
+# skipped without a query. False positives only skip an insert.
+SEEN_CAPACITY = 1_000_000
+SEEN_ERROR_RATE = 0.001
+_seen_urls: Optional[Bloom] = None
+_seen_contents: Optional[Bloom] = None
+
+
+def _content_digest(raw_content: bytes) -> str:
+    """Digest of compressed review content, matching PostgreSQL's md5(raw_content)."""
+    return hashlib.md5(raw_content).hexdigest()
+
+
+def _get_seen_filters(db) -> tuple[Bloom, Bloom]:
+    """Get the stored-review Bloom filters, loading them on first use."""
+    global _seen_urls, _seen_contents
+
+    if _seen_urls is None:
+        seen_urls = Bloom(SEEN_CAPACITY, SEEN_ERROR_RATE)
+        seen_contents = Bloom(SEEN_CAPACITY, SEEN_ERROR_RATE)
+
+        # Content is hashed server-side so only digests cross the wire
+        rows = db.execute(
+            text("SELECT source_url, md5(raw_content) FROM review_sources")
+            .execution_options(stream_results=True)
+        )
+        for source_url, digest in rows:
+            seen_urls.add(source_url)
+            if digest:
+                seen_contents.add(digest)
+
+        _seen_urls, _seen_contents = seen_urls, seen_contents
+
+    return _seen_urls, _seen_contents
+
+
+# Event loop kept running in a background thread for the life of the worker
+# process, so the shared HTTP client, browser and other loop-bound pools
+# stay warm across tasks. Started lazily, since threads do not survive the
+# prefork pool's fork.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the worker process's event loop, starting its thread on first use."""
+    global _loop, _loop_thread
+
+    with _loop_lock:
+        if _loop_thread is None or not _loop_thread.is_alive():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(target=_loop.run_forever, daemon=True)
+            _loop_thread.start()
+
+    return _loop
+
+
+def _get_scraper(source: str):
+    """Get a source's scraper singleton, importing its module on first use.
+
+    Resolved through the scrapers package's lazy attributes, so a worker only
+    loads a source's dependencies (googleapiclient, bs4, ...) once a task
+    needs that source.
+    """
+    return getattr(scraper_registry, f"{source}_scraper")
+
+
 def run_async(coro):
     """Helper to run async functions in sync context."""
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(coro)
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+@worker_process_shutdown.connect
+def close_shared_clients(**kwargs):
+    """Close the shared browser, HTTP client and scrape cache when the worker process exits."""
+    run_async(close_browser())
+    run_async(close_http_client())
+    run_async(close_scrape_cache())
+
+
+async def _search_all(scrapers: list, product_name: str, force_rescrape: bool = False) -> list:
+    """Search every scraper concurrently, returning results or exceptions in order."""
+    # Scoped to this coroutine's context, so it never leaks into later tasks
+    bypass_scrape_cache.set(force_rescrape)
+    return await asyncio.gather(
+        *(scraper.search(product_name, limit=10) for _, scraper in scrapers),
+        return_exceptions=True,
+    )
 
 
 @celery_app.task(bind=True, max_retries=3)
-def scrape_product_reviews(self, product_id: str, product_name: str, category: str = None):
+def scrape_product_reviews(
+    self,
+    product_id: str,
+    product_name: str,
+    category: str = None,
+    force_rescrape: bool = False,
+):
     """
     Scrape reviews for a product from all sources.
 
@@ -48,6 +196,7 @@ def scrape_product_reviews(self, product_id: str, product_name: str, category: s
         product_id: UUID of the product in database
         product_name: Name of the product to search for
         category: Optional category to help target relevant sources
+        force_rescrape: Fetch pages fresh instead of using cached scrapes
     """
     try:
         print(f"Starting scrape for product: {product_name} ({product_id})")
@@ -55,63 +204,77 @@ def scrape_product_reviews(self, product_id: str, product_name: str, category: s
         all_reviews = []
 
         # Scrape from each source
-        scrapers = [
-            ("reddit", reddit_scraper),
-            ("youtube", youtube_scraper),
-            ("wirecutter", wirecutter_scraper),
-            ("rtings", rtings_scraper),
-            ("techradar", techradar_scraper),
-        ]
+        sources = ["reddit", "youtube", "wirecutter", "rtings", "techradar"]
 
         # Add forum scrapers based on category
         if category in ["headphones", "audio", "electronics"]:
-            scrapers.append(("headfi", headfi_scraper))
+            sources.append("headfi")
         if category in ["home_theater", "tv", "audio"]:
-            scrapers.append(("avsforum", avsforum_scraper))
+            sources.append("avsforum")
+
+        scrapers = [(source, _get_scraper(source)) for source in sources]
 
-        for name, scraper in scrapers:
-            try:
-                print(f"  Scraping {name}...")
-                reviews = run_async(scraper.search(product_name, limit=10))
-                all_reviews.extend(reviews)
-                print(f"  Found {len(reviews)} reviews from {name}")
-            except Exception as e:
-                print(f"  Error scraping {name}: {e}")
+        # Scrape all sources concurrently on the worker's event loop
+        print(f"  Scraping {', '.join(name for name, _ in scrapers)}...")
+        results = run_async(_search_all(scrapers, product_name, force_rescrape))
+
+        for (name, _), reviews in zip(scrapers, results):
+            if isinstance(reviews, BaseException):
+                print(f"  Error scraping {name}: {reviews}")
+                continue
+            all_reviews.extend(reviews)
+            print(f"  Found {len(reviews)} reviews from {name}")
 
         print(f"Total reviews collected: {len(all_reviews)}")
 
+        # Drop reviews quoted or cross-posted across sources, so they are
+        # neither stored nor analyzed twice
+        collected = len(all_reviews)
+        all_reviews = dedupe_reviews(all_reviews)
+        if len(all_reviews) < collected:
+            print(f"Dropped {collected - len(all_reviews)} near-duplicate reviews")
+
         if not all_reviews:
             print("No reviews found, skipping rating calculation")
             return {"status": "no_reviews", "product_id": product_id}
 
-        # Save reviews to database
+        # Save new reviews to database in a single batched insert
+        new_urls = set()
+        new_digests = set()
         with get_db() as db:
+            seen_urls, seen_contents = _get_seen_filters(db)
+
+            params = []
             for review in all_reviews:
-                # Check if already exists
-                existing = db.execute(
-                    text("SELECT id FROM review_sources WHERE source_url = :url"),
-                    {"url": review.source_url}
-                ).fetchone()
+                # Skip reviews already stored, checking the URL before paying
+                # to compress and hash the content
+                if review.source_url in seen_urls or review.source_url in new_urls:
+                    continue
 
-                if existing:
+                # Skip content already stored under another URL
+                raw_content = _compress_content(review.content)
+                digest = _content_digest(raw_content)
+                if digest in seen_contents or digest in new_digests:
                     continue
 
-                db.execute(
-                    text("""
-                        INSERT INTO review_sources
-                        (product_id, source_type, source_url, source_name, raw_content, upvotes, comment_count, scraped_at)
-                        VALUES (:product_id, :source_type, :source_url, :source_name, :raw_content, :upvotes, :comment_count, NOW())
-                    """),
-                    {
-                        "product_id": product_id,
-                        "source_type": review.source_type,
-                        "source_url": review.source_url,
-                        "source_name": review.source_name,
-                        "raw_content": review.content,
-                        "upvotes": review.upvotes,
-                        "comment_count": review.comment_count,
-                    }
-                )
+                params.append({
+                    "product_id": product_id,
+                    "source_type": review.source_type,
+                    "source_url": review.source_url,
+                    "source_name": review.source_name,
+                    "raw_content": raw_content,
+                    "upvotes": review.upvotes,
+                    "comment_count": review.comment_count,
+                })
+                new_urls.add(review.source_url)
+                new_digests.add(digest)
+
+            if params:
+                _insert_reviews(db, params)
+
+        # Only remember reviews once their transaction has committed
+        seen_urls.update(new_urls)
+        seen_contents.update(new_digests)
 
         # Calculate rating
         print("Calculating AI rating...")
@@ -211,32 +374,51 @@ def refresh_stale_ratings(days_threshold: int = 7):
             )
 
 
+# Sources by site domain; subdomains (www., m., old.) resolve to their parent
+SOURCES_BY_DOMAIN = {
+    "reddit.com": "reddit",
+    "youtube.com": "youtube",
+    "youtu.be": "youtube",
+    "nytimes.com": "wirecutter",
+    "rtings.com": "rtings",
+    "techradar.com": "techradar",
+    "head-fi.org": "headfi",
+    "avsforum.com": "avsforum",
+}
+
+
+def _scraper_for_url(url: str):
+    """Find the scraper for a URL by its host, or None if unsupported."""
+    parsed = urlparse(url)
+    labels = (parsed.hostname or "").split(".")
+
+    for i in range(len(labels) - 1):
+        source = SOURCES_BY_DOMAIN.get(".".join(labels[i:]))
+        if source:
+            # Only Wirecutter articles are scrapable on nytimes.com
+            if source == "wirecutter" and not parsed.path.startswith("/wirecutter"):
+                return None
+            return _get_scraper(source)
+
+    return None
+
+
 @celery_app.task
-def scrape_url(url: str, product_id: str = None):
+def scrape_url(url: str, product_id: str = None, force_rescrape: bool = False):
     """
     Scrape a specific URL and optionally associate with a product.
 
     Args:
         url: URL to scrape
         product_id: Optional product ID to associate the review with
+        force_rescrape: Fetch the page fresh instead of using a cached scrape
     """
     review = None
 
     # Determine scraper based on URL
-    if "reddit.com" in url:
-        review = run_async(reddit_scraper.scrape_url(url))
-    elif "youtube.com" in url or "youtu.be" in url:
-        review = run_async(youtube_scraper.scrape_url(url))
-    elif "nytimes.com/wirecutter" in url:
-        review = run_async(wirecutter_scraper.scrape_url(url))
-    elif "rtings.com" in url:
-        review = run_async(rtings_scraper.scrape_url(url))
-    elif "techradar.com" in url:
-        review = run_async(techradar_scraper.scrape_url(url))
-    elif "head-fi.org" in url:
-        review = run_async(headfi_scraper.scrape_url(url))
-    elif "avsforum.com" in url:
-        review = run_async(avsforum_scraper.scrape_url(url))
+    scraper = _scraper_for_url(url)
+    if scraper:
+        review = run_async(scraper.cached_scrape_url(url, force_rescrape))
 
     if not review:
         return {"status": "failed", "url": url}
@@ -245,18 +427,13 @@ def scrape_url(url: str, product_id: str = None):
     if product_id:
         with get_db() as db:
             db.execute(
-                text("""
-                    INSERT INTO review_sources
-                    (product_id, source_type, source_url, source_name, raw_content, upvotes, comment_count, scraped_at)
-                    VALUES (:product_id, :source_type, :source_url, :source_name, :raw_content, :upvotes, :comment_count, NOW())
-                    ON CONFLICT (source_url) DO NOTHING
-                """),
+                INSERT_REVIEW_SQL,
                 {
                     "product_id": product_id,
                     "source_type": review.source_type,
                     "source_url": review.source_url,
                     "source_name": review.source_name,
-                    "raw_content": review.content,
+                    "raw_content": _compress_content(review.content),
                     "upvotes": review.upvotes,
                     "comment_count": review.comment_count,
                 }